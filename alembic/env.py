@@ -8,14 +8,14 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
 # Імпортуємо налаштування з config.py
-from src.conf.config import settings
+from src.conf.config import get_settings
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
 
-# Встановлюємо sqlalchemy.url з settings.database_url
-config.set_main_option("sqlalchemy.url", settings.database_url)
+# Встановлюємо sqlalchemy.url з get_settings().database_url
+config.set_main_option("sqlalchemy.url", get_settings().database_url)
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
@@ -50,7 +50,7 @@ def run_migrations_offline() -> None:
 
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode."""
-    connectable = create_engine(settings.database_url)
+    connectable = create_engine(get_settings().database_url)
 
     with connectable.connect() as connection:
         context.configure(
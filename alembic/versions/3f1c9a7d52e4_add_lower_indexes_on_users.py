@@ -0,0 +1,48 @@
+"""Add unique lower() indexes on users email and username
+
+Revision ID: 3f1c9a7d52e4
+Revises: aaeab1c5bffb
+Create Date: 2026-10-14 10:12:31.482915
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a7d52e4'
+down_revision: Union[str, None] = 'aaeab1c5bffb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _check_case_insensitive_duplicates() -> None:
+    # The original unique constraints are case-sensitive, so "Bob" and "bob"
+    # may both exist; the unique lower() indexes below would fail to build.
+    conn = op.get_bind()
+    for column in ('email', 'username'):
+        query = (
+            f'SELECT lower({column}) FROM users '
+            f'GROUP BY lower({column}) HAVING count(*) > 1'
+        )
+        duplicates = conn.execute(sa.text(query)).scalars().all()
+        if duplicates:
+            raise RuntimeError(
+                f'{len(duplicates)} value(s) of users.{column} differ only by '
+                f'case. List them with "{query}" and rename or merge those '
+                f'accounts before running this migration.'
+            )
+
+
+def upgrade() -> None:
+    if not context.is_offline_mode():
+        _check_case_insensitive_duplicates()
+    op.create_index('ix_users_email_lower', 'users', [sa.text('lower(email)')], unique=True)
+    op.create_index('ix_users_username_lower', 'users', [sa.text('lower(username)')], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_username_lower', table_name='users')
+    op.drop_index('ix_users_email_lower', table_name='users')
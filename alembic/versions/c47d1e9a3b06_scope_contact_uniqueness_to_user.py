@@ -0,0 +1,32 @@
+"""Scope contact email and phone uniqueness to the owning user
+
+Revision ID: c47d1e9a3b06
+Revises: 3f1c9a7d52e4
+Create Date: 2026-10-14 16:05:42.903117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c47d1e9a3b06'
+down_revision: Union[str, None] = '3f1c9a7d52e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_constraint('contacts_email_key', 'contacts', type_='unique')
+    op.drop_constraint('contacts_phone_key', 'contacts', type_='unique')
+    op.create_unique_constraint('uq_contacts_user_id_email', 'contacts', ['user_id', 'email'])
+    op.create_unique_constraint('uq_contacts_user_id_phone', 'contacts', ['user_id', 'phone'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_contacts_user_id_phone', 'contacts', type_='unique')
+    op.drop_constraint('uq_contacts_user_id_email', 'contacts', type_='unique')
+    op.create_unique_constraint('contacts_phone_key', 'contacts', ['phone'])
+    op.create_unique_constraint('contacts_email_key', 'contacts', ['email'])
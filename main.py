@@ -6,9 +6,11 @@ from slowapi.errors import RateLimitExceeded
 from alembic import command
 from alembic.config import Config
 
+from src.conf.config import get_settings
 
 logging.basicConfig()
-logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)\
+if get_settings().SQL_ECHO:
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
 # Ініціалізація логера
 logger = logging.getLogger("rate_limiter")
 
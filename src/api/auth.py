@@ -1,10 +1,10 @@
+import asyncio
 import logging
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.conf.config import settings
 from src.database.database import get_db
 from src.schemas import RequestEmail, Token, User, UserCreate
 from src.services.auth import Hash, create_access_token, get_email_from_token
@@ -15,6 +15,12 @@ logger = logging.getLogger("rate_limiter")
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+_hasher = Hash()
+
+# Verified against when the user does not exist, so that a failed login costs
+# the same bcrypt work whether or not the username is registered.
+_DUMMY_HASH = _hasher.get_password_hash("x")
+
 
 @router.post("/register", response_model=User, status_code=status.HTTP_201_CREATED)
 async def register_user(
@@ -23,25 +29,12 @@ async def register_user(
     request: Request,
     db: AsyncSession = Depends(get_db),
 ):
-    logger.info("Received registration request: %s", user.dict())
+    logger.info("Received registration request for %s", user.username)
     service = UserService(db)
-    print("Received request:", user)
     try:
-        existing_user_by_email = await service.get_user_by_email(user.email)
-        if existing_user_by_email:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="User with this email already exists",
-            )
-
-        existing_user_by_username = await service.get_user_by_username(user.username)
-        if existing_user_by_username:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="User with this username already exists",
-            )
-
-        user.password = Hash().get_password_hash(user.password)
+        user.password = await asyncio.to_thread(
+            _hasher.get_password_hash, user.password
+        )
         logger.info("Password hashed successfully")
 
         new_user = await service.create_user(user)
@@ -51,6 +44,8 @@ async def register_user(
             send_email, new_user.email, new_user.username, request.base_url
         )
         return new_user
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("Error in register_user: %s", str(e))
         raise HTTPException(
@@ -66,8 +61,18 @@ async def login_user(
     service = UserService(db)
     db_user = await service.get_user_by_username(form_data.username)
 
-    if not db_user or not Hash().verify_password(
-        form_data.password, db_user.hashed_password
+    if db_user is None:
+        await asyncio.to_thread(
+            _hasher.verify_password, form_data.password, _DUMMY_HASH
+        )
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect login or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    if not await asyncio.to_thread(
+        _hasher.verify_password, form_data.password, db_user.hashed_password
     ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -3,9 +3,9 @@ from slowapi import Limiter
 from slowapi.util import get_remote_address
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.conf.config import settings
+from src.conf.config import Settings, get_settings
 from src.database.database import get_db
-from src.schemas import User
+from src.schemas import User, UserWithContacts
 from src.services.auth import get_current_user
 from src.services.uploadfile import UploadFileService
 from src.services.users import UserService
@@ -15,11 +15,18 @@ limiter = Limiter(key_func=get_remote_address)
 
 
 @router.get(
-    "/me", response_model=User, description="No more than 10 requests per minute"
+    "/me",
+    response_model=UserWithContacts,
+    description="No more than 10 requests per minute",
 )
 @limiter.limit("10 per minute")
-async def me(request: Request, user: User = Depends(get_current_user)):
-    return user
+async def me(
+    request: Request,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    user_service = UserService(db)
+    return await user_service.get_user_by_id(user.id)
 
 
 @router.patch("/avatar", response_model=User)
@@ -27,9 +34,12 @@ async def update_avatar_user(
     file: UploadFile = File(),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    settings: Settings = Depends(get_settings),
 ):
     avatar_url = UploadFileService(
-        settings.CLD_NAME, settings.CLD_API_KEY, settings.CLD_API_SECRET
+        settings.CLOUDINARY_CLOUD_NAME,
+        settings.CLOUDINARY_API_KEY,
+        settings.CLOUDINARY_API_SECRET,
     ).upload_file(file, user.username)
 
     user_service = UserService(db)
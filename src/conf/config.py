@@ -1,5 +1,7 @@
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
-from pydantic import ConfigDict, EmailStr
+from pydantic import ConfigDict, EmailStr, Field
 
 
 class Settings(BaseSettings):
@@ -9,6 +11,7 @@ class Settings(BaseSettings):
     DB_PASSWORD: str
     DB_HOST: str
     DB_PORT: str
+    SQL_ECHO: bool = False
 
     # JWT
     JWT_SECRET: str
@@ -16,6 +19,13 @@ class Settings(BaseSettings):
     JWT_EXPIRATION_SECONDS: int = 3600
     JWT_REFRESH_EXPIRATION_SECONDS: int
 
+    # Password hashing
+    BCRYPT_ROUNDS: int = Field(default=12, ge=4, le=31)
+
+    # Cache
+    USER_CACHE_TTL_SECONDS: int = 600
+    USER_CACHE_MAXSIZE: int = Field(default=4096, ge=1)
+
     # Cloudinary
     CLOUDINARY_CLOUD_NAME: str
     CLOUDINARY_API_KEY: str
@@ -42,4 +52,6 @@ class Settings(BaseSettings):
     )
 
 
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    return Settings()
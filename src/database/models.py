@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String, DateTime, Date, Column, func, Boolean,ForeignKey
+from sqlalchemy import Integer, String, DateTime, Date, Column, func, Boolean,ForeignKey, Index, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -10,8 +10,8 @@ class Contact(Base):
     id = Column(Integer, primary_key=True)
     name = Column(String(50), nullable=False)
     surname = Column(String(50), nullable=False)
-    email = Column(String(100), nullable=False, unique=True)
-    phone = Column(String(20), nullable=False, unique=True)
+    email = Column(String(100), nullable=False)
+    phone = Column(String(20), nullable=False)
     birthday = Column(Date, nullable=False)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
@@ -19,7 +19,12 @@ class Contact(Base):
     user_id = Column(
         "user_id", ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
-    user = relationship("User", backref="contacts",  lazy="joined")
+    user = relationship("User", back_populates="contacts")
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "email", name="uq_contacts_user_id_email"),
+        UniqueConstraint("user_id", "phone", name="uq_contacts_user_id_phone"),
+    )
 
 
 class User(Base):
@@ -32,4 +37,10 @@ class User(Base):
     created_at = Column(DateTime, default=func.now())
     is_verified = Column(Boolean, default=False)
     avatar_url = Column(String, nullable=True)
-    contacts = relationship("Contact", backref="user",  lazy="joined")
\ No newline at end of file
+    contacts = relationship("Contact", back_populates="user")
+
+    __table_args__ = (
+        Index("ix_users_email_lower", func.lower(email), unique=True),
+        Index("ix_users_username_lower", func.lower(username), unique=True),
+    )
+    __mapper_args__ = {"eager_defaults": True}
@@ -2,6 +2,7 @@ from datetime import date, timedelta
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, or_, func
+from sqlalchemy.exc import IntegrityError
 
 from src.database.models import Contact, User
 from src.schemas import ContactModel
@@ -11,21 +12,14 @@ class ContactRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def is_contact_exists(self, email: str, phone: str, user: User) -> bool:
-        result = await self.db.execute(
-            select(Contact).filter(
-                and_(
-                    or_(Contact.email == email, Contact.phone == phone),
-                    Contact.user_id == user.id,
-                )
-            )
-        )
-        return result.scalar_one_or_none() is not None
-
     async def create_contact(self, body: ContactModel, user: User) -> Contact:
         db_contact = Contact(**body.model_dump(exclude_unset=True), user=user)
         self.db.add(db_contact)
-        await self.db.commit()
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            raise
         await self.db.refresh(db_contact)
         return db_contact
 
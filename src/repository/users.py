@@ -1,47 +1,136 @@
 import logging
+import time
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, inspect, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached, selectinload
 
+from src.conf.config import get_settings
 from src.database.models import User
 from src.schemas import UserCreate
 
 logger = logging.getLogger("rate_limiter")
 
+# Column snapshots of users keyed by id, in insertion order, plus an index from
+# ("email" | "username", lowercased value) to that id. Snapshots are plain
+# dicts, so no ORM instance is ever shared between sessions.
+_user_cache: dict[int, tuple[float, dict]] = {}
+_user_cache_index: dict[tuple[str, str], int] = {}
+# Bumped on every invalidation; a lookup that started before a bump must not
+# store what it read.
+_user_cache_generation = 0
+
+
+def _snapshot(user: User) -> dict:
+    return {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+
+
+def _cache_drop(user_id: int) -> None:
+    entry = _user_cache.pop(user_id, None)
+    if entry is None:
+        return
+    _, snapshot = entry
+    _user_cache_index.pop(("email", snapshot["email"].lower()), None)
+    _user_cache_index.pop(("username", snapshot["username"].lower()), None)
+
+
+def _cache_get(key: tuple[str, str]) -> dict | None:
+    user_id = _user_cache_index.get(key)
+    if user_id is None:
+        return None
+    expires_at, snapshot = _user_cache[user_id]
+    if expires_at < time.monotonic():
+        _cache_drop(user_id)
+        return None
+    return snapshot
+
+
+def _cache_set(snapshot: dict, generation: int) -> None:
+    if generation != _user_cache_generation:
+        return
+    settings = get_settings()
+    _cache_drop(snapshot["id"])
+    while len(_user_cache) >= settings.USER_CACHE_MAXSIZE:
+        _cache_drop(next(iter(_user_cache)))
+    expires_at = time.monotonic() + settings.USER_CACHE_TTL_SECONDS
+    _user_cache[snapshot["id"]] = (expires_at, snapshot)
+    _user_cache_index[("email", snapshot["email"].lower())] = snapshot["id"]
+    _user_cache_index[("username", snapshot["username"].lower())] = snapshot["id"]
+
+
+def _cache_invalidate(user: User) -> None:
+    global _user_cache_generation
+    _user_cache_generation += 1
+    _cache_drop(user.id)
+
 
 class UserRepository:
+    # Built once and reused, so each lookup only binds parameters.
+    _STMT_BY_ID = (
+        select(User)
+        .options(selectinload(User.contacts))
+        .filter(User.id == bindparam("user_id"))
+    )
+    # Both sides go through Postgres lower(), so matching never depends on
+    # Python and the database lowercasing non-ASCII text the same way.
+    _STMT_BY_USERNAME = select(User).filter(
+        func.lower(User.username) == func.lower(bindparam("username"))
+    )
+    _STMT_BY_EMAIL = select(User).filter(
+        func.lower(User.email) == func.lower(bindparam("email"))
+    )
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
     async def get_user_by_id(self, user_id: int) -> User | None:
-        stmt = select(User).filter(User.id == user_id)
-        result = await self.db.execute(stmt)
+        result = await self.db.execute(self._STMT_BY_ID, {"user_id": user_id})
         return result.scalar_one_or_none()
 
+    async def _get_cached_user(self, field: str, value: str, stmt) -> User | None:
+        snapshot = _cache_get((field, value.lower()))
+        if snapshot is None:
+            generation = _user_cache_generation
+            result = await self.db.execute(stmt, {field: value})
+            user = result.scalar_one_or_none()
+            if user is not None:
+                _cache_set(_snapshot(user), generation)
+            return user
+
+        # Like a query, prefer the instance this session already holds.
+        user = self.db.identity_map.get(self.db.identity_key(User, snapshot["id"]))
+        if user is not None:
+            return user
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+        return await self.db.merge(user, load=False)
+
     async def get_user_by_username(self, username: str) -> User | None:
-        stmt = select(User).filter(User.username == username)
-        result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        return await self._get_cached_user(
+            "username", username, self._STMT_BY_USERNAME
+        )
 
     async def get_user_by_email(self, email: str) -> User | None:
-        stmt = select(User).filter(User.email == email)
-        result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        return await self._get_cached_user("email", email, self._STMT_BY_EMAIL)
 
     async def create_user(self, user: UserCreate, avatar_url: str = None) -> User:
-        logger.info("Attempting to create user: %s", user.dict())
         try:
             db_user = User(
-                **user.model_dump(exclude_unset=True, exclude={"password"}),
+                username=user.username,
+                email=user.email,
                 hashed_password=user.password,
                 avatar_url=avatar_url,
                 is_verified=False,
             )
             self.db.add(db_user)
+            await self.db.flush()
             await self.db.commit()
             logger.info("User successfully added to database")
-            await self.db.refresh(db_user)
             return db_user
+        except IntegrityError:
+            await self.db.rollback()
+            raise
         except Exception as e:
             logger.error("Error creating user in repository: %s", str(e))
             await self.db.rollback()
@@ -50,13 +139,17 @@ class UserRepository:
     async def confirmed_email(self, email: str) -> None:
         user = await self.get_user_by_email(email)
         if user:
+            _cache_invalidate(user)
             user.is_verified = True
             await self.db.commit()
+            _cache_invalidate(user)
 
     async def update_avatar_url(self, email: str, url: str) -> User:
         user = await self.get_user_by_email(email)
         if user:
+            _cache_invalidate(user)
             user.avatar_url = url
             await self.db.commit()
             await self.db.refresh(user)
+            _cache_invalidate(user)
         return user
@@ -2,7 +2,9 @@ import re
 from datetime import date, datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field, validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
+
+_PHONE_RE = re.compile(r"^\+?[1-9]\d{1,14}$")
 
 
 class ContactModel(BaseModel):
@@ -16,16 +18,17 @@ class ContactModel(BaseModel):
     info: Optional[str] = Field(None, max_length=500, example="Additional info")
     user_id: int = Field(example=1)
 
-    @validator("phone")
+    @field_validator("phone")
+    @classmethod
     def validate_phone(cls, value):
-        phone_regex = r"^\+?[1-9]\d{1,14}$"
-        if not re.match(phone_regex, value):
+        if not _PHONE_RE.match(value):
             raise ValueError(
                 "Phone number must be in international format (e.g., +380501234567)"
             )
         return value
 
-    @validator("birthday")
+    @field_validator("birthday")
+    @classmethod
     def validate_birthday(cls, value):
         if value > date.today():
             raise ValueError("Birthday cannot be in the future")
@@ -51,10 +54,13 @@ class User(BaseModel):
     email: EmailStr
     is_verified: bool
     avatar_url: Optional[str]
-    contacts: List[ContactResponse] = []
     model_config = ConfigDict(from_attributes=True)
 
 
+class UserWithContacts(User):
+    contacts: List[ContactResponse] = []
+
+
 class Token(BaseModel):
     access_token: str
     token_type: str = "bearer"
@@ -1,6 +1,8 @@
 from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.database.database import is_unique_violation
 from src.database.models import User
 from src.repository.contacts import ContactRepository
 from src.schemas import ContactModel
@@ -11,12 +13,15 @@ class ContactService:
         self.repository = ContactRepository(db)
 
     async def create_contact(self, body: ContactModel, user: User):
-        if await self.repository.is_contact_exists(body.email, body.phone, user):
+        try:
+            return await self.repository.create_contact(body, user)
+        except IntegrityError as e:
+            if not is_unique_violation(e):
+                raise
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Contact with '{body.email}' email or '{body.phone}' phone number already exists.",
             )
-        return await self.repository.create_contact(body, user)
 
     async def get_contacts(
         self, name: str, surname: str, email: str, skip: int, limit: int, user: User
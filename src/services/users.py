@@ -1,7 +1,10 @@
 import logging
 
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.database.database import is_unique_violation
 from src.repository.users import UserRepository
 from src.schemas import User, UserCreate
 
@@ -13,9 +16,17 @@ class UserService:
         self.repository = UserRepository(db)
 
     async def create_user(self, user: UserCreate, avatar_url: str = None) -> User:
-        logger.info("Creating user in service: %s", user.dict())
+        logger.info("Creating user in service: %s", user.username)
         try:
             return await self.repository.create_user(user, avatar_url)
+        except IntegrityError as e:
+            if is_unique_violation(e):
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="User with this email or username already exists",
+                )
+            logger.error("Error in UserService.create_user: %s", str(e))
+            raise
         except Exception as e:
             logger.error("Error in UserService.create_user: %s", str(e))
             raise